@@ -1,15 +1,107 @@
 """API for Yamaha XMV Amplifier."""
 import asyncio
 import logging
-from typing import Callable, Dict, Optional
+import random
+import re
+import socket
+from typing import Callable, Coroutine, Dict, Optional, Set, Tuple
 
-from .const import AMP_MUTE_VALUE, RECONNECT_DELAY_INITIAL, RECONNECT_DELAY_MAX
+from .const import (
+    AMP_MUTE_VALUE, KEEP_ALIVE_IDLE, RECONNECT_DELAY_INITIAL, RECONNECT_DELAY_MAX,
+    VOLUME_DEBOUNCE_DELAY,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 HANDSHAKE_RESPONSE = 'OK devstatus runmode "normal"'
+_HANDSHAKE_CMD = b"devstatus runmode\n"
+_HANDSHAKE_RESPONSE_B = HANDSHAKE_RESPONSE.encode("ascii")
 PATH_ID_POWER = "60003"
 PATH_ID_VOLUME = "60002"
+# Replies are short single lines; cap the receive buffer accordingly.
+READ_LIMIT = 4096
+_PATH_ID_POWER_B = PATH_ID_POWER.encode("ascii")
+_PATH_ID_VOLUME_B = PATH_ID_VOLUME.encode("ascii")
+
+# A successful test_connection is kept open this long for the client to reuse.
+WARM_CONNECTION_TTL = 10  # seconds
+# One already-handshaken connection per (host, port), with its expiry timer.
+_WARM: Dict[
+    Tuple[str, int],
+    Tuple[asyncio.Transport, "_XmvProtocol", asyncio.TimerHandle],
+] = {}
+
+# Captures command id, channel id and value from a get/set reply or NOTIFY.
+_MSG_RE = re.compile(
+    rb"^(?:OK (?:get|set)|NOTIFY set) MTX:mem_512/(\d+)/0/(\d+)/0/0/0 0 0 (-?\d+)"
+)
+
+class _XmvProtocol(asyncio.Protocol):
+    """Split the amplifier's byte stream into lines and hand them to a callback."""
+
+    def __init__(self):
+        self.transport: Optional[asyncio.Transport] = None
+        self.on_line: Optional[Callable[[bytes], None]] = None
+        self.on_lost: Optional[Callable[["_XmvProtocol"], None]] = None
+        self.closed: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._buf = bytearray()
+        self._waiter: Optional[asyncio.Future] = None
+
+    def connection_made(self, transport: asyncio.Transport):
+        self.transport = transport
+
+    def data_received(self, data: bytes):
+        buf = self._buf
+        buf += data
+        # Handle every complete line in this chunk before returning to the loop.
+        while True:
+            idx = buf.find(b"\n")
+            if idx < 0:
+                break
+            line = bytes(buf[:idx]).rstrip()
+            del buf[:idx + 1]
+            if self._waiter and not self._waiter.done():
+                self._waiter.set_result(line)
+            elif self.on_line:
+                self.on_line(line)
+        if len(buf) > READ_LIMIT:
+            _LOGGER.warning("Discarding oversized message from amplifier.")
+            buf.clear()
+
+    def connection_lost(self, exc: Optional[Exception]):
+        if self._waiter and not self._waiter.done():
+            self._waiter.set_exception(ConnectionResetError("Connection lost"))
+        if not self.closed.done():
+            self.closed.set_result(None)
+        if self.on_lost:
+            self.on_lost(self)
+
+    async def request_line(self, data: bytes, timeout: float) -> bytes:
+        """Send data and return the next line received."""
+        self._waiter = asyncio.get_running_loop().create_future()
+        self.transport.write(data)
+        try:
+            return await asyncio.wait_for(self._waiter, timeout=timeout)
+        finally:
+            self._waiter = None
+
+
+async def _open(host: str, port: int) -> Tuple[asyncio.Transport, _XmvProtocol]:
+    """Open a connection and perform the handshake, raising on failure."""
+    transport, protocol = await asyncio.wait_for(
+        asyncio.get_running_loop().create_connection(_XmvProtocol, host, port),
+        timeout=5.0
+    )
+    try:
+        response = await protocol.request_line(_HANDSHAKE_CMD, timeout=5.0)
+    except BaseException:
+        transport.close()
+        raise
+    if response.strip() != _HANDSHAKE_RESPONSE_B:
+        transport.close()
+        raise ConnectionError("Handshake failed with unexpected response.")
+    return transport, protocol
+
 
 class AmplifierClient:
     """A client to communicate with a Yamaha XMV amplifier."""
@@ -18,23 +110,33 @@ class AmplifierClient:
     async def test_connection(host: str, port: int) -> bool:
         """Test the connection to the amplifier."""
         _LOGGER.debug("Testing connection to %s:%s", host, port)
-        reader, writer = None, None
         try:
-            reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(host, port),
-                timeout=5.0
-            )
-            writer.write(b"devstatus runmode\n")
-            await writer.drain()
-            response = await asyncio.wait_for(reader.readline(), timeout=5.0)
-            return response.decode("ascii").strip() == HANDSHAKE_RESPONSE
+            transport, protocol = await _open(host, port)
         except Exception as e:
             _LOGGER.debug("Test connection failed: %s", e)
             return False
-        finally:
-            if writer:
-                writer.close()
-                await writer.wait_closed()
+        AmplifierClient._store_warm(host, port, transport, protocol)
+        return True
+
+    @staticmethod
+    def _store_warm(
+        host: str, port: int, transport: asyncio.Transport, protocol: _XmvProtocol
+    ):
+        """Keep a handshaken connection briefly so the client can skip reconnecting."""
+        key = (host, port)
+        AmplifierClient._discard_warm(key)
+        handle = asyncio.get_running_loop().call_later(
+            WARM_CONNECTION_TTL, AmplifierClient._discard_warm, key
+        )
+        _WARM[key] = (transport, protocol, handle)
+
+    @staticmethod
+    def _discard_warm(key: Tuple[str, int]):
+        """Close and forget the warm connection for a host, if any."""
+        warm = _WARM.pop(key, None)
+        if warm:
+            warm[2].cancel()
+            warm[0].close()
 
     def __init__(self, host: str, port: int, min_db: int, max_db: int):
         """Initialize the client."""
@@ -42,51 +144,69 @@ class AmplifierClient:
         self._port = port
         self._min_db_100 = min_db * 100
         self._max_db_100 = max_db * 100
-        self._reader: Optional[asyncio.StreamReader] = None
-        self._writer: Optional[asyncio.StreamWriter] = None
-        self._listen_task: Optional[asyncio.Task] = None
+        self._db_range = self._max_db_100 - self._min_db_100
+        self._inv_db_range = 1.0 / self._db_range if self._db_range else 0.0
+        self._transport: Optional[asyncio.Transport] = None
+        self._protocol: Optional[_XmvProtocol] = None
         self._manager_task: Optional[asyncio.Task] = None
         self._callbacks: Dict[str, list[Callable]] = {}
-        self._lock = asyncio.Lock()
+        # Dispatch snapshots rebuilt on registration, keyed by encoded channel id.
+        self._cb_by_cid: Dict[bytes, Tuple[Callable, ...]] = {}
+        self._all_cbs: Tuple[Callable, ...] = ()
         self._is_connected = False
         self._keep_alive_task: Optional[asyncio.Task] = None
         self._keep_alive_channel_id: Optional[str] = None
-
+        self._ka_bytes: Optional[bytes] = None
+        self._last_rx = 0.0
+        # Pre-encoded per-channel commands; the set templates take one %d value.
+        self._tmpl_power: Dict[str, bytes] = {}
+        self._tmpl_volume: Dict[str, bytes] = {}
+        self._tmpl_get_power: Dict[str, bytes] = {}
+        self._tmpl_get_volume: Dict[str, bytes] = {}
+        # Latest requested volume per channel, flushed once per debounce window.
+        self._pending_vol: Dict[str, float] = {}
+        self._vol_flush_handle: Dict[str, asyncio.TimerHandle] = {}
+        # Every background task, so disconnect can cancel and await them all.
+        self._tasks: Set[asyncio.Task] = set()
+
+
+    def _spawn(self, coro: Coroutine) -> asyncio.Task:
+        """Create a background task that is tracked until it finishes."""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
 
     def start(self):
         """Start the connection manager and keep-alive task."""
         if not self._manager_task:
-            self._manager_task = asyncio.create_task(self._connection_manager())
+            self._manager_task = self._spawn(self._connection_manager())
         if not self._keep_alive_task:
-            self._keep_alive_task = asyncio.create_task(self._keep_alive_manager())
+            self._keep_alive_task = self._spawn(self._keep_alive_manager())
 
     async def disconnect(self):
         """Disconnect from the amplifier and stop the manager."""
-        if self._manager_task:
-            self._manager_task.cancel()
-            self._manager_task = None
-        if self._keep_alive_task:
-            self._keep_alive_task.cancel()
-            self._keep_alive_task = None
-        
-        await self._close_connection()
+        self._manager_task = None
+        self._keep_alive_task = None
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._close_connection()
         _LOGGER.info("Client permanently disconnected.")
 
-    async def _close_connection(self):
-        """Close the active connection and listener."""
-        if self._listen_task:
-            self._listen_task.cancel()
-            self._listen_task = None
-
-        if self._writer:
-            self._writer.close()
-            try:
-                await self._writer.wait_closed()
-            except Exception:
-                pass
-
-        self._reader = None
-        self._writer = None
+    def _close_connection(self):
+        """Close the active connection."""
+        for handle in self._vol_flush_handle.values():
+            handle.cancel()
+        self._vol_flush_handle.clear()
+        self._pending_vol.clear()
+
+        if self._transport:
+            self._transport.close()
+        self._transport = None
+        self._protocol = None
         if self._is_connected:
             self._is_connected = False
             self._notify_availability(False)
@@ -104,24 +224,18 @@ class AmplifierClient:
                         _LOGGER.info("Connection successful. Resetting reconnect delay.")
                         reconnect_delay = RECONNECT_DELAY_INITIAL
                         
-                        # We are connected. Start the listener.
-                        self._listen_task = asyncio.create_task(self._listen())
-                        
-                        # Now, wait for the listener to stop for any reason.
-                        try:
-                            await self._listen_task
-                        except asyncio.CancelledError:
-                            # This is expected if _close_connection was called.
-                            # We just let it loop again.
-                            _LOGGER.debug("Listen task was cancelled, loop will retry.")
-                            pass
+                        # We are connected. Wait for the connection to drop for
+                        # any reason; incoming lines are handled by the protocol.
+                        await self._protocol.closed
                     else:
-                        # Connection failed, wait and increase backoff
+                        # Connection failed, wait and increase backoff. Full jitter
+                        # keeps clients from reconnecting in lockstep after a reboot.
+                        delay = random.uniform(0, min(reconnect_delay * 2, RECONNECT_DELAY_MAX))
                         _LOGGER.warning(
-                            "Connection failed. Will retry in %d seconds.",
-                            reconnect_delay,
+                            "Connection failed. Will retry in %.1f seconds.",
+                            delay,
                         )
-                        await asyncio.sleep(reconnect_delay)
+                        await asyncio.sleep(delay)
                         reconnect_delay = min(reconnect_delay * 2, RECONNECT_DELAY_MAX)
                 else:
                     # This state should not be possible, but as a safeguard.
@@ -138,98 +252,120 @@ class AmplifierClient:
 
     async def _connect_and_handshake(self) -> bool:
         """Establish connection and perform handshake."""
+        warm = _WARM.pop((self._host, self._port), None)
+        if warm:
+            transport, protocol, handle = warm
+            handle.cancel()
+            if not transport.is_closing():
+                _LOGGER.debug("Reusing connection from connection test.")
+                self._attach(transport, protocol)
+                return True
+
         try:
-            self._reader, self._writer = await asyncio.wait_for(
-                asyncio.open_connection(self._host, self._port),
-                timeout=5.0
-            )
-        except (ConnectionRefusedError, OSError, asyncio.TimeoutError) as e:
-            _LOGGER.debug("Connection attempt failed during open: %s", e)
+            transport, protocol = await _open(self._host, self._port)
+        except (OSError, asyncio.TimeoutError) as e:
+            _LOGGER.debug("Connection attempt failed: %s", e)
             return False
 
+        _LOGGER.info("Handshake successful. Notifying entities and querying state.")
+        self._attach(transport, protocol)
+        return True
+
+    def _attach(self, transport: asyncio.Transport, protocol: _XmvProtocol):
+        """Adopt a handshaken connection and resync all channels."""
+        self._transport = transport
+        self._protocol = protocol
+        protocol.on_line = self._handle_line
+        protocol.on_lost = self._handle_connection_lost
+        self._enable_tcp_keepalive()
+        self._last_rx = asyncio.get_running_loop().time()
+
+        self._is_connected = True
+        self._notify_availability(True)
+        # Query every channel in one write; replies are matched by channel id.
+        if self._callbacks:
+            self._send_command_bytes(b"".join(
+                self._tmpl_get_power[cid] + self._tmpl_get_volume[cid]
+                for cid in self._callbacks
+            ))
+
+    def _handle_connection_lost(self, protocol: _XmvProtocol):
+        """Tear down state when the active connection drops."""
+        # A connection we closed ourselves has already been detached.
+        if protocol is self._protocol:
+            _LOGGER.warning("Connection lost.")
+            self._close_connection()
+
+    def _enable_tcp_keepalive(self):
+        """Let the kernel detect a dead peer instead of relying on pings alone."""
+        sock = self._transport.get_extra_info("socket")
+        if sock is None:
+            return
         try:
-            handshake_cmd = "devstatus runmode\n"
-            self._writer.write(handshake_cmd.encode("ascii"))
-            await self._writer.drain()
-
-            response = await asyncio.wait_for(self._reader.readline(), timeout=5.0)
-            if response.decode("ascii").strip() == HANDSHAKE_RESPONSE:
-                self._is_connected = True
-                _LOGGER.info("Handshake successful. Notifying entities and querying state.")
-                self._notify_availability(True)
-                for channel_id in self._callbacks:
-                    await self.async_query_channel_state(channel_id)
-                return True
-            else:
-                _LOGGER.warning("Handshake failed with unexpected response.")
-                await self._close_connection()
-                return False
-        except (asyncio.TimeoutError, OSError, BrokenPipeError) as e:
-            _LOGGER.warning("Connection attempt failed during handshake: %s", e)
-            await self._close_connection()
-            return False
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Tuning knobs are Linux-specific.
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 45)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 15)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 4)
+        except OSError as e:
+            _LOGGER.debug("Could not enable TCP keep-alive: %s", e)
 
     def _notify_availability(self, available: bool):
         """Notify all registered channels of connection status."""
         _LOGGER.debug("Notifying availability: %s", available)
-        for channel_id in self._callbacks:
-            for callback in self._callbacks[channel_id]:
-                callback({"available": available})
-
-    async def _listen(self):
-        """Listen for incoming data from the amplifier."""
-        _LOGGER.info("Starting listener for amplifier messages.")
-        while self._is_connected and self._reader:
-            try:
-                data = await self._reader.readline()
-                if not data:
-                    _LOGGER.warning("Connection lost.")
-                    await self._close_connection()
-                    break
-
-                message = data.decode("ascii").strip()
-                _LOGGER.debug("Received: %s", message)
-
-                if message.startswith(("OK get", "OK set", "NOTIFY set")):
-                    self._process_message(message)
-
-            except (asyncio.CancelledError, ConnectionResetError):
-                _LOGGER.info("Listener stopped.")
-                # Don't call _close_connection here, just let the task die.
-                # The manager will see it exit and handle the state.
-                break
-            except Exception as e:
-                _LOGGER.exception("Error in listener task: %s", e)
-                await self._close_connection()
-                break
-    
+        update_data = {"available": available}
+        for callback in self._all_cbs:
+            callback(update_data)
+
+    def _handle_line(self, line: bytes):
+        """Handle one line received from the amplifier."""
+        self._last_rx = asyncio.get_running_loop().time()
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Received: %s", line.decode("ascii", "replace"))
+
+        if line.startswith((b"OK get", b"OK set", b"NOTIFY set")):
+            self._process_message(line)
+
     # --- THIS IS THE NEW KEEP-ALIVE TASK ---
     async def _keep_alive_manager(self):
-        """Periodically send a command to ensure the connection is alive."""
+        """Ping the amplifier only after the connection has been idle for a while."""
+        loop = asyncio.get_running_loop()
         while True:
-            await asyncio.sleep(60) # Ping every 60 seconds
             try:
-                if self._is_connected and self._keep_alive_channel_id:
+                idle = loop.time() - self._last_rx
+                if idle < KEEP_ALIVE_IDLE:
+                    # Traffic was seen recently; sleep until it could go stale.
+                    await asyncio.sleep(KEEP_ALIVE_IDLE - idle)
+                    continue
+                if self._is_connected and self._ka_bytes:
                     _LOGGER.debug("Sending keep-alive ping.")
-                    command = f"get MTX:mem_512/{PATH_ID_POWER}/0/{self._keep_alive_channel_id}/0/0/0 0 0\n"
-                    # Use _send_command directly, as it has the error handling
-                    await self._send_command(command)
+                    self._send_command_bytes(self._ka_bytes)
+                await asyncio.sleep(KEEP_ALIVE_IDLE)
             except asyncio.CancelledError:
                 _LOGGER.info("Keep-alive manager cancelled.")
                 break
             except Exception as e:
                 # Log errors but don't stop the keep-alive loop
                 _LOGGER.error("Error in keep-alive manager: %s", e)
+                await asyncio.sleep(KEEP_ALIVE_IDLE)
 
     async def register_callback(self, channel_id: str, callback: Callable):
         """Register a callback for a specific channel's updates."""
         if channel_id not in self._callbacks:
             self._callbacks[channel_id] = []
         self._callbacks[channel_id].append(callback)
-        _LOGGER.debug("Registered callback for channel %s", channel_id)
+        self._cb_by_cid[channel_id.encode("ascii")] = tuple(self._callbacks[channel_id])
+        self._all_cbs = self._all_cbs + (callback,)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Registered callback for channel %s", channel_id)
+
+        if channel_id not in self._tmpl_power:
+            self._build_templates(channel_id)
 
         if not self._keep_alive_channel_id:
             self._keep_alive_channel_id = channel_id
+            self._ka_bytes = self._tmpl_get_power[channel_id]
             _LOGGER.info("Using channel %s for keep-alive pings.", channel_id)
 
         if self._is_connected:
@@ -237,75 +373,87 @@ class AmplifierClient:
             callback({"available": True})
             await self.async_query_channel_state(channel_id)
 
-    def _process_message(self, message: str):
-        """Parse a message and trigger callbacks."""
-        try:
-            parts = message.split()
-            address_path = parts[2].split('/')
-            command_id = address_path[1]
-            channel_id = address_path[3]
-
-            if channel_id not in self._callbacks: return
-
-            update_data = {}
-            value = int(parts[5])
+    def _build_templates(self, channel_id: str):
+        """Encode the command strings for a channel once, up front."""
+        power = f"MTX:mem_512/{PATH_ID_POWER}/0/{channel_id}/0/0/0 0 0"
+        volume = f"MTX:mem_512/{PATH_ID_VOLUME}/0/{channel_id}/0/0/0 0 0"
+        self._tmpl_power[channel_id] = f"set {power} %d\n".encode("ascii")
+        self._tmpl_volume[channel_id] = f"set {volume} %d\n".encode("ascii")
+        self._tmpl_get_power[channel_id] = f"get {power}\n".encode("ascii")
+        self._tmpl_get_volume[channel_id] = f"get {volume}\n".encode("ascii")
 
-            if command_id == PATH_ID_POWER:
-                update_data["power"] = value == 1
-            elif command_id == PATH_ID_VOLUME:
-                if value == AMP_MUTE_VALUE:
-                    update_data["mute"] = True
+    def _process_message(self, data: bytes):
+        """Parse a message and trigger callbacks."""
+        m = _MSG_RE.match(data)
+        if not m: return
+        callbacks = self._cb_by_cid.get(m.group(2))
+        if not callbacks: return
+
+        command_id = m.group(1)
+        value = int(m.group(3))
+        update_data = {}
+
+        if command_id == _PATH_ID_POWER_B:
+            update_data["power"] = value == 1
+        elif command_id == _PATH_ID_VOLUME_B:
+            if value == AMP_MUTE_VALUE:
+                update_data["mute"] = True
+            else:
+                update_data["mute"] = False
+                if self._db_range:
+                    ha_volume = (value - self._min_db_100) * self._inv_db_range
+                    ha_volume = 0.0 if ha_volume < 0.0 else 1.0 if ha_volume > 1.0 else ha_volume
                 else:
-                    update_data["mute"] = False
-                    db_range = self._max_db_100 - self._min_db_100
-                    ha_volume = (value - self._min_db_100) / db_range if db_range != 0 else 1.0
-                    update_data["volume"] = max(0.0, min(1.0, ha_volume))
-            else: return
-
-            if update_data:
-                for callback in self._callbacks[channel_id]:
-                    callback(update_data)
-
-        except (IndexError, ValueError) as e:
-            _LOGGER.warning("Could not parse message: '%s' - Error: %s", message, e)
-
-    async def _send_command(self, command: str):
-        """Send a command to the amplifier if connected."""
-        if not self._is_connected or not self._writer:
-            _LOGGER.warning("Cannot send command, not connected: %s", command.strip())
+                    ha_volume = 1.0
+                update_data["volume"] = ha_volume
+        else: return
+
+        for callback in callbacks:
+            callback(update_data)
+
+    def _send_command_bytes(self, command: bytes):
+        """Write an already encoded command to the amplifier if connected."""
+        if not self._is_connected or not self._transport:
+            _LOGGER.warning(
+                "Cannot send command, not connected: %s", command.decode("ascii").strip()
+            )
             return
-        
-        async with self._lock:
-            _LOGGER.debug("Sending command: %s", command.strip())
-            try:
-                self._writer.write(command.encode("ascii"))
-                await self._writer.drain()
-            except (OSError, ConnectionResetError) as e:
-                _LOGGER.error("Failed to send command, connection lost: %s", e)
-                await self._close_connection()
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Sending command: %s", command.decode("ascii").strip())
+        self._transport.write(command)
 
     async def async_query_channel_state(self, channel_id: str):
         """Send 'get' commands to fetch the current state of a channel."""
-        commands = [
-            f"get MTX:mem_512/{PATH_ID_POWER}/0/{channel_id}/0/0/0 0 0\n",
-            f"get MTX:mem_512/{PATH_ID_VOLUME}/0/{channel_id}/0/0/0 0 0\n",
-        ]
-        for cmd in commands:
-            await self._send_command(cmd)
-            await asyncio.sleep(0.1)
+        # Both queries go out in a single write; the amp answers them in order.
+        self._send_command_bytes(
+            self._tmpl_get_power[channel_id] + self._tmpl_get_volume[channel_id]
+        )
 
     async def async_set_power(self, channel_id: str, is_on: bool):
-        value = 1 if is_on else 0
-        command = f"set MTX:mem_512/{PATH_ID_POWER}/0/{channel_id}/0/0/0 0 0 {value}\n"
-        await self._send_command(command)
+        self._send_command_bytes(self._tmpl_power[channel_id] % (1 if is_on else 0))
 
     async def async_set_mute(self, channel_id: str, is_muted: bool):
         if not is_muted: return
-        command = f"set MTX:mem_512/{PATH_ID_VOLUME}/0/{channel_id}/0/0/0 0 0 {AMP_MUTE_VALUE}\n"
-        await self._send_command(command)
+        # Mute shares the volume parameter; a held-back volume would unmute it.
+        handle = self._vol_flush_handle.pop(channel_id, None)
+        if handle:
+            handle.cancel()
+        self._pending_vol.pop(channel_id, None)
+        self._send_command_bytes(self._tmpl_volume[channel_id] % AMP_MUTE_VALUE)
 
     async def async_set_volume(self, channel_id: str, ha_volume: float):
-        db_range = self._max_db_100 - self._min_db_100
-        amp_volume = int(self._min_db_100 + (ha_volume * db_range))
-        command = f"set MTX:mem_512/{PATH_ID_VOLUME}/0/{channel_id}/0/0/0 0 0 {amp_volume}\n"
-        await self._send_command(command)
\ No newline at end of file
+        """Set a channel's volume, coalescing rapid changes into one command."""
+        self._pending_vol[channel_id] = ha_volume
+        if channel_id not in self._vol_flush_handle:
+            self._vol_flush_handle[channel_id] = asyncio.get_running_loop().call_later(
+                VOLUME_DEBOUNCE_DELAY, self._flush_volume, channel_id
+            )
+
+    def _flush_volume(self, channel_id: str):
+        """Send the latest pending volume for a channel."""
+        self._vol_flush_handle.pop(channel_id, None)
+        ha_volume = self._pending_vol.pop(channel_id, None)
+        if ha_volume is None: return
+        amp_volume = int(self._min_db_100 + (ha_volume * self._db_range))
+        self._send_command_bytes(self._tmpl_volume[channel_id] % amp_volume)
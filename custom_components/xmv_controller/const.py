@@ -9,6 +9,12 @@ AMP_MUTE_VALUE = -13801
 RECONNECT_DELAY_INITIAL = 5  # seconds
 RECONNECT_DELAY_MAX = 60    # 60 secs
 
+# Send an application-level ping after this much receive silence
+KEEP_ALIVE_IDLE = 60  # seconds
+
+# Window in which rapid volume changes are coalesced into one command
+VOLUME_DEBOUNCE_DELAY = 0.05  # seconds
+
 # Default values for configuration
 DEFAULT_HOST = "192.168.1.5"
 DEFAULT_PORT = 49280
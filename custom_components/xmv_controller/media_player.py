@@ -60,27 +60,39 @@ class XmvMediaPlayer(MediaPlayerEntity):
         self._attr_volume_level = None
         self._attr_is_volume_muted = None
         self._pre_mute_volume: float | None = None
+        self._write_scheduled = False
 
     @callback
     def _handle_update(self, update_data: dict) -> None:
         """Handle an update from the API client."""
-        _LOGGER.debug("Update for channel %s: %s", self._channel_id, update_data)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Update for channel %s: %s", self._channel_id, update_data)
         updated = False
-        if "available" in update_data:
+        if "available" in update_data and update_data["available"] != self._attr_available:
             self._attr_available = update_data["available"]
             updated = True
         if "power" in update_data:
-            self._attr_state = MediaPlayerState.ON if update_data["power"] else MediaPlayerState.OFF
-            updated = True
-        if "volume" in update_data:
+            state = MediaPlayerState.ON if update_data["power"] else MediaPlayerState.OFF
+            if state != self._attr_state:
+                self._attr_state = state
+                updated = True
+        if "volume" in update_data and update_data["volume"] != self._attr_volume_level:
             self._attr_volume_level = update_data["volume"]
             updated = True
-        if "mute" in update_data:
+        if "mute" in update_data and update_data["mute"] != self._attr_is_volume_muted:
             self._attr_is_volume_muted = update_data["mute"]
             updated = True
-        
-        if updated:
-            self.async_write_ha_state()
+
+        # Updates often arrive back-to-back; write the state once per loop iteration.
+        if updated and not self._write_scheduled:
+            self._write_scheduled = True
+            self.hass.loop.call_soon(self._flush_state)
+
+    @callback
+    def _flush_state(self) -> None:
+        """Write the coalesced state to Home Assistant."""
+        self._write_scheduled = False
+        self.async_write_ha_state()
 
     # --- MODIFIED: This method is now async ---
     async def async_added_to_hass(self) -> None:
@@ -91,18 +103,28 @@ class XmvMediaPlayer(MediaPlayerEntity):
         # or the _connect_and_handshake methods now handle it.
 
     async def async_turn_on(self) -> None:
+        # Update the UI right away; a contradicting NOTIFY will overwrite it.
+        self._attr_state = MediaPlayerState.ON
+        self.async_write_ha_state()
         await self._api.async_set_power(self._channel_id, True)
 
     async def async_turn_off(self) -> None:
+        self._attr_state = MediaPlayerState.OFF
+        self.async_write_ha_state()
         await self._api.async_set_power(self._channel_id, False)
 
     async def async_set_volume_level(self, volume: float) -> None:
+        self._attr_volume_level = volume
+        self._attr_is_volume_muted = False
+        self.async_write_ha_state()
         await self._api.async_set_volume(self._channel_id, volume)
 
     async def async_mute_volume(self, mute: bool) -> None:
         if mute:
             self._pre_mute_volume = self._attr_volume_level
+            self._attr_is_volume_muted = True
+            self.async_write_ha_state()
             await self._api.async_set_mute(self._channel_id, True)
         else:
             volume_to_restore = self._pre_mute_volume or 0.5
-            await self.async_set_volume_level(volume_to_restore)
\ No newline at end of file
+            await self.async_set_volume_level(volume_to_restore)